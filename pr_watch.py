@@ -9,18 +9,31 @@ beyond your own authored ones.
 Exposes all PR data as JSON at ~/.pr-watch/prs.json for agent consumption.
 """
 
+import copy
+import functools
+import gzip
+import hashlib
+import http.client
 import json
 import logging
 import logging.handlers
+import os
 import re
+import shutil
 import subprocess
 import threading
+import time
 import webbrowser
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, replace
 from datetime import datetime, timezone
 from pathlib import Path
 from threading import Event, Thread
+from types import MappingProxyType
 
+import orjson
 import rumps
+from PyObjCTools import AppHelper
 
 # ── Paths ──────────────────────────────────────────────────────────────
 DATA_DIR = Path.home() / ".pr-watch"
@@ -52,119 +65,76 @@ DEFAULT_CONFIG = {
     "watched_prs": [],  # list of PR URLs
 }
 
-GRAPHQL_QUERY = """
-{
-  search(query: "%QUERY%", type: ISSUE, first: 50) {
+# Quiet period after a dismiss/add before refetching, so bursts coalesce
+FETCH_DEBOUNCE_SECONDS = 0.5
+
+PR_FIELDS_FRAGMENT = """
+fragment PRFields on PullRequest {
+  number
+  title
+  url
+  isDraft
+  state
+  createdAt
+  updatedAt
+  mergeable
+  author { login }
+  repository {
+    nameWithOwner
+  }
+  reviewDecision
+  commits(last: 1) {
     nodes {
-      ... on PullRequest {
-        number
-        title
-        url
-        isDraft
-        state
-        createdAt
-        updatedAt
-        mergeable
-        repository {
-          nameWithOwner
-        }
-        reviewDecision
-        commits(last: 1) {
-          nodes {
-            commit {
-              statusCheckRollup {
+      commit {
+        statusCheckRollup {
+          state
+          contexts(first: 100) {
+            nodes {
+              ... on CheckRun {
+                name
+                conclusion
+                status
+              }
+              ... on StatusContext {
+                context
                 state
-                contexts(first: 100) {
-                  nodes {
-                    ... on CheckRun {
-                      name
-                      conclusion
-                      status
-                    }
-                    ... on StatusContext {
-                      context
-                      state
-                    }
-                  }
-                }
               }
             }
           }
         }
-        mergeQueueEntry { state position }
-        autoMergeRequest { enabledAt }
-        reviews(last: 10) {
-          nodes {
-            state
-            author { login }
-          }
-        }
-        labels(first: 10) {
-          nodes { name }
-        }
       }
     }
   }
+  mergeQueueEntry { state position }
+  autoMergeRequest { enabledAt }
+  reviews(last: 10) {
+    nodes {
+      state
+      author { login }
+    }
+  }
+  labels(first: 10) {
+    nodes { name }
+  }
 }
 """
 
 PR_DETAIL_QUERY = """
 query($owner: String!, $repo: String!, $number: Int!) {
   repository(owner: $owner, name: $repo) {
-    pullRequest(number: $number) {
-      number
-      title
-      url
-      isDraft
-      state
-      createdAt
-      updatedAt
-      mergeable
-      author { login }
-      repository {
-        nameWithOwner
-      }
-      reviewDecision
-      commits(last: 1) {
-        nodes {
-          commit {
-            statusCheckRollup {
-              state
-              contexts(first: 100) {
-                nodes {
-                  ... on CheckRun {
-                    name
-                    conclusion
-                    status
-                  }
-                  ... on StatusContext {
-                    context
-                    state
-                  }
-                }
-              }
-            }
-          }
-        }
-      }
-      mergeQueueEntry { state position }
-      autoMergeRequest { enabledAt }
-      reviews(last: 10) {
-        nodes {
-          state
-          author { login }
-        }
-      }
-      labels(first: 10) {
-        nodes { name }
-      }
-    }
+    pullRequest(number: $number) { ...PRFields }
   }
 }
-"""
+""" + PR_FIELDS_FRAGMENT
+
+# Authored (search) and watched PRs are fetched as fields of one query, with an
+# aliased pullRequest field per watched PR. Cap the aliases per request so a
+# long watch list stays well under GitHub's node/complexity limits.
+WATCHED_BATCH_SIZE = 15
 
 
 # ── Status helpers ─────────────────────────────────────────────────────
+@functools.lru_cache(maxsize=None)  # pure function of a few low-cardinality enums
 def combined_icon(ci_state: str | None, review_decision: str | None, pr_state: str = "OPEN", in_merge_queue: bool = False, mergeable: str | None = None) -> str:
     """Single icon reflecting the overall PR status (CI + review combined)."""
     # Merged or closed
@@ -196,48 +166,68 @@ def combined_icon(ci_state: str | None, review_decision: str | None, pr_state: s
     return "⚪"
 
 
+_CI_ICON = MappingProxyType({
+    "SUCCESS": "✅",
+    "FAILURE": "❌",
+    "ERROR": "❌",
+    "PENDING": "🟡",
+    "EXPECTED": "🟡",
+    None: "⚪",
+})
+
+_REVIEW_ICON = MappingProxyType({
+    "APPROVED": "✅",
+    "CHANGES_REQUESTED": "🔴",
+    "REVIEW_REQUIRED": "👀",
+    None: "—",
+})
+
+_CI_LABEL = MappingProxyType({
+    "SUCCESS": "CI green",
+    "FAILURE": "CI failing",
+    "ERROR": "CI error",
+    "PENDING": "CI running",
+    None: "No CI",
+})
+
+_REVIEW_LABEL = MappingProxyType({
+    "APPROVED": "Approved",
+    "CHANGES_REQUESTED": "Changes requested",
+    "REVIEW_REQUIRED": "Needs review",
+    None: "No reviews",
+})
+
+_PR_URL_PREFIXES = ("https://github.com/", "http://github.com/")
+_PR_URL_RE = re.compile(r"https?://github\.com/([^/]+)/([^/]+)/pull/(\d+)")
+
+
 def ci_icon(state: str | None) -> str:
-    return {
-        "SUCCESS": "✅",
-        "FAILURE": "❌",
-        "ERROR": "❌",
-        "PENDING": "🟡",
-        "EXPECTED": "🟡",
-        None: "⚪",
-    }.get(state, "⚪")
+    return _CI_ICON.get(state, "⚪")
 
 
 def review_icon(decision: str | None) -> str:
-    return {
-        "APPROVED": "✅",
-        "CHANGES_REQUESTED": "🔴",
-        "REVIEW_REQUIRED": "👀",
-        None: "—",
-    }.get(decision, "—")
+    return _REVIEW_ICON.get(decision, "—")
 
 
 def ci_label(state: str | None) -> str:
-    return {
-        "SUCCESS": "CI green",
-        "FAILURE": "CI failing",
-        "ERROR": "CI error",
-        "PENDING": "CI running",
-        None: "No CI",
-    }.get(state, "Unknown")
+    return _CI_LABEL.get(state, "Unknown")
 
 
 def review_label(decision: str | None) -> str:
-    return {
-        "APPROVED": "Approved",
-        "CHANGES_REQUESTED": "Changes requested",
-        "REVIEW_REQUIRED": "Needs review",
-        None: "No reviews",
-    }.get(decision, "Unknown")
+    return _REVIEW_LABEL.get(decision, "Unknown")
 
 
 def parse_pr_url(url: str) -> tuple[str, str, int] | None:
     """Extract (owner, repo, number) from a GitHub PR URL."""
-    m = re.match(r"https?://github\.com/([^/]+)/([^/]+)/pull/(\d+)", url.strip().rstrip("/"))
+    url = url.strip().rstrip("/")
+    # Fast path for plain .../owner/repo/pull/N URLs; anything else goes to the regex
+    if url.startswith(_PR_URL_PREFIXES):
+        parts = url.split("/", 6)[3:]
+        if len(parts) == 4:
+            owner, repo, pull, num = parts
+            if owner and repo and pull == "pull" and num.isascii() and num.isdigit():
+                return owner, repo, int(num)
+    m = _PR_URL_RE.match(url)
     if m:
         return m.group(1), m.group(2), int(m.group(3))
     return None
@@ -248,11 +238,20 @@ def normalize_url(url: str) -> str:
     return url.strip().rstrip("/")
 
 
-def time_ago(iso_str: str) -> str:
-    """Convert ISO timestamp to relative time string."""
-    dt = datetime.fromisoformat(iso_str.replace("Z", "+00:00"))
-    delta = datetime.now(timezone.utc) - dt
-    seconds = int(delta.total_seconds())
+@functools.lru_cache(maxsize=512)  # updatedAt values rarely change between refreshes
+def _parse_iso(iso_str: str) -> float:
+    """ISO timestamp to POSIX seconds."""
+    return datetime.fromisoformat(iso_str.replace("Z", "+00:00")).timestamp()
+
+
+def time_ago(iso_str: str, now: float | None = None) -> str:
+    """Convert ISO timestamp to relative time string.
+
+    Pass `now` (POSIX seconds) to share one clock reading across many PRs.
+    """
+    if now is None:
+        now = time.time()
+    seconds = int(now - _parse_iso(iso_str))
     if seconds < 60:
         return "just now"
     elif seconds < 3600:
@@ -266,34 +265,98 @@ def time_ago(iso_str: str) -> str:
         return f"{d}d ago"
 
 
+# ── PR model ───────────────────────────────────────────────────────────
+@dataclass(frozen=True, slots=True)
+class PR:
+    """A normalized PR. Field names are the keys written to prs.json."""
+    number: int | None
+    title: str
+    url: str
+    repo: str
+    repo_short: str
+    isDraft: bool
+    state: str
+    createdAt: str | None
+    updatedAt: str | None
+    mergeable: str | None
+    in_merge_queue: bool
+    merge_queue_position: int | None
+    ci_state: str | None
+    ci_icon: str
+    ci_label: str
+    review_decision: str | None
+    review_icon: str
+    review_label: str
+    status_icon: str
+    checks: list[dict]
+    reviews: list[dict]
+    labels: list[str]
+    source: str
+    author: str | None
+
+
 # ── Config ─────────────────────────────────────────────────────────────
+# Parsed config and the config.json mtime it was read at
+_config_cache: dict | None = None
+_config_mtime_ns: int | None = None
+
+
 def load_config() -> dict:
-    DATA_DIR.mkdir(parents=True, exist_ok=True)
-    if CONFIG_FILE.exists():
-        with open(CONFIG_FILE) as f:
-            cfg = json.load(f)
-        # Backfill any missing keys
-        for k, v in DEFAULT_CONFIG.items():
-            cfg.setdefault(k, v)
+    """Load config.json, reparsing only when the file has changed on disk."""
+    global _config_cache, _config_mtime_ns
+    try:
+        mtime_ns = CONFIG_FILE.stat().st_mtime_ns
+    except FileNotFoundError:
+        cfg = copy.deepcopy(DEFAULT_CONFIG)
+        save_config(cfg)
         return cfg
-    else:
-        save_config(DEFAULT_CONFIG)
-        return dict(DEFAULT_CONFIG)
+    if _config_cache is not None and mtime_ns == _config_mtime_ns:
+        return _config_cache
+    with open(CONFIG_FILE) as f:
+        cfg = json.load(f)
+    # Backfill any missing keys
+    for k, v in DEFAULT_CONFIG.items():
+        cfg.setdefault(k, copy.deepcopy(v))
+    _config_cache, _config_mtime_ns = cfg, mtime_ns
+    return cfg
 
 
 def save_config(cfg: dict):
+    global _config_cache, _config_mtime_ns
     DATA_DIR.mkdir(parents=True, exist_ok=True)
     with open(CONFIG_FILE, "w") as f:
         json.dump(cfg, f, indent=2)
+    _config_cache, _config_mtime_ns = cfg, CONFIG_FILE.stat().st_mtime_ns
 
 
 # ── GitHub API ─────────────────────────────────────────────────────────
-def run_gh(*args: str, input_data: str | None = None) -> str | None:
-    """Run a gh CLI command and return stdout, or None on failure."""
+API_HOST = "api.github.com"
+
+
+@functools.lru_cache(maxsize=None)
+def _exe(name: str) -> str:
+    """Absolute path of an executable, resolved once.
+
+    subprocess only takes its posix_spawn fast path (instead of fork+exec,
+    which has to copy the page tables of this long-lived process) for an
+    absolute path with close_fds=False. Our fds are non-inheritable by
+    default, so leaving close_fds off leaks nothing.
+    """
+    return shutil.which(name) or name
+
+
+def run_gh(*args: str, input_data: str | None = None, json_on_error: bool = False) -> str | None:
+    """Run a gh CLI command and return stdout, or None on failure.
+
+    With json_on_error, a non-zero exit still returns stdout if it holds a
+    JSON body: `gh api graphql` exits 1 whenever the response has an
+    "errors" array, even when most of "data" came back.
+    """
     cmd_summary = " ".join(args[:3])
     try:
         result = subprocess.run(
-            ["gh", *args],
+            [_exe("gh"), *args],
+            close_fds=False,
             capture_output=True,
             text=True,
             timeout=30,
@@ -301,6 +364,9 @@ def run_gh(*args: str, input_data: str | None = None) -> str | None:
         )
         if result.returncode == 0:
             return result.stdout
+        elif json_on_error and result.stdout.lstrip().startswith("{"):
+            log.warning("gh error (cmd=%s): %s", cmd_summary, result.stderr.strip())
+            return result.stdout
         else:
             log.warning("gh error (cmd=%s): %s", cmd_summary, result.stderr.strip())
             return None
@@ -312,41 +378,339 @@ def run_gh(*args: str, input_data: str | None = None) -> str | None:
         return None
 
 
-def fetch_my_prs(query: str) -> list[dict]:
-    """Fetch authored PRs via GraphQL search."""
-    gql = GRAPHQL_QUERY.replace("%QUERY%", query.replace('"', '\\"'))
-    raw = run_gh("api", "graphql", "-f", f"query={gql}")
-    if not raw:
-        return []
-    try:
-        data = json.loads(raw)
-        nodes = data.get("data", {}).get("search", {}).get("nodes", [])
-        return [normalize_pr(n, source="authored") for n in nodes if n]
-    except (json.JSONDecodeError, KeyError) as e:
-        print(f"Parse error: {e}")
-        return []
+class GitHubClient:
+    """Keep-alive HTTPS client for api.github.com, authenticated with the gh token.
 
+    Avoids a gh process spawn and a fresh TLS handshake per API call.
+    http.client connections aren't thread-safe, so each thread gets its own.
+    """
 
-def fetch_single_pr(owner: str, repo: str, number: int) -> dict | None:
-    """Fetch a single PR by owner/repo/number."""
-    raw = run_gh(
-        "api", "graphql",
-        "-f", f"query={PR_DETAIL_QUERY}",
-        "-F", f"owner={owner}",
-        "-F", f"repo={repo}",
-        "-F", f"number={number}",
-    )
-    if not raw:
+    def __init__(self, token: str):
+        self._headers = {
+            "Authorization": f"bearer {token}",
+            "Accept": "application/vnd.github+json",
+            "Accept-Encoding": "gzip",
+            "User-Agent": "pr-watch",
+        }
+        self._local = threading.local()
+        # Rate-limit resource ("core" / "graphql") -> time until which requests are held off
+        self._blocked_until: dict[str, float] = {}
+
+    def _conn(self) -> http.client.HTTPSConnection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._local.conn = http.client.HTTPSConnection(API_HOST, timeout=30)
+        return conn
+
+    def request(
+        self, method: str, path: str, body: bytes | None = None, headers: dict | None = None,
+    ) -> tuple[int, http.client.HTTPMessage, bytes] | None:
+        """Send a request and return (status, headers, body), or None on failure.
+
+        A 401 re-reads the gh token and retries once; a persistent 401 disables
+        the client, so callers fall back to gh. A transport/TLS failure (e.g.
+        offline, or just after wake from sleep) fails only this call.
+        """
+        resource = "graphql" if path == "/graphql" else "core"
+        if time.time() < self._blocked_until.get(resource, 0.0):
+            log.warning("rate limited — skipping %s %s", method, path)
+            return None
+        extra = dict(headers or {})
+        if body is not None:
+            extra["Content-Type"] = "application/json"
+        retried_conn = retried_auth = False
+        while True:
+            conn = self._conn()
+            try:
+                conn.request(method, path, body=body, headers={**self._headers, **extra})
+                resp = conn.getresponse()
+                data = resp.read()
+            except TimeoutError:
+                conn.close()
+                self._local.conn = None
+                log.error("GitHub API timeout after 30s (%s %s)", method, path)
+                return None
+            except (http.client.HTTPException, OSError) as e:
+                conn.close()
+                self._local.conn = None
+                if not retried_conn:
+                    # The server may have dropped an idle keep-alive connection;
+                    # retry once on a fresh one.
+                    retried_conn = True
+                    continue
+                log.error("GitHub API exception (%s %s): %s", method, path, e)
+                return None
+            self._note_rate_limit(resource, resp)
+            if resp.status == 401:
+                if not retried_auth and self._refresh_token():
+                    retried_auth = True
+                    continue
+                _disable_client("HTTP 401")
+                return None
+            if resp.getheader("Content-Encoding") == "gzip":
+                data = gzip.decompress(data)
+            return resp.status, resp.headers, data
+
+    def _refresh_token(self) -> bool:
+        """Re-read the gh token, e.g. after the user re-ran `gh auth login`."""
+        token = _gh_token()
+        if not token:
+            return False
+        self._headers["Authorization"] = f"bearer {token}"
+        return True
+
+    def _note_rate_limit(self, resource: str, resp: http.client.HTTPResponse):
+        """Back off until the limit resets once GitHub reports it exhausted."""
+        try:
+            retry_after = resp.getheader("Retry-After")
+            if resp.status in (403, 429) and retry_after:
+                until = time.time() + int(retry_after)
+            elif resp.getheader("X-RateLimit-Remaining") == "0":
+                until = float(resp.getheader("X-RateLimit-Reset") or 0)
+            else:
+                return
+        except ValueError:
+            return
+        self._blocked_until[resource] = until
+        log.warning("GitHub %s rate limit hit — backing off until %s", resource,
+                    datetime.fromtimestamp(until).strftime("%H:%M:%S"))
+
+
+_client: GitHubClient | None = None
+
+# Shared pool for concurrent API calls. Long-lived threads keep their
+# keep-alive connections warm across fetch cycles.
+FETCH_WORKERS = 8
+_pool = ThreadPoolExecutor(max_workers=FETCH_WORKERS, thread_name_prefix="pr-watch-fetch")
+
+
+def _gh_token() -> str:
+    return (run_gh("auth", "token") or "").strip()
+
+
+def init_github_client():
+    """Resolve the gh auth token and open the API client.
+
+    If no token is available, API calls fall back to the gh CLI.
+    """
+    global _client
+    token = _gh_token()
+    if token:
+        _client = GitHubClient(token)
+        log.info("using direct GitHub API client")
+    else:
+        _client = None
+        log.warning("no gh auth token — falling back to gh CLI for API calls")
+
+
+def _disable_client(reason: str):
+    """Stop using the API client; later calls go through the gh CLI."""
+    global _client
+    if _client is not None:
+        _client = None
+        log.warning("disabling direct GitHub API client (%s) — falling back to gh CLI", reason)
+
+
+# REST responses keyed by path: (etag, requested fields). A 304 for a conditional
+# request costs no rate limit and skips the download and parse entirely.
+_etag_cache: dict[str, tuple[str, dict]] = {}
+
+
+def _api_get(path: str, fields: tuple[str, ...]) -> dict | None:
+    """GET a REST endpoint via the API client and return the requested fields of its JSON.
+
+    Only those fields are cached: a full pull request body carries both
+    repository objects and runs to tens of KB.
+    """
+    client = _client
+    if client is None:
         return None
+    cached = _etag_cache.get(path)
+    result = client.request("GET", path, headers={"If-None-Match": cached[0]} if cached else None)
+    if result is None:
+        return None
+    status, headers, body = result
+    if status == 304 and cached:
+        return cached[1]
+    if status != 200:
+        log.warning("GitHub API error (GET %s): HTTP %d", path, status)
+        return None
+    try:
+        parsed = orjson.loads(body)
+    except orjson.JSONDecodeError as e:
+        log.warning("parse error (GET %s): %s", path, e)
+        return None
+    data = {k: parsed.get(k) for k in fields}
+    if headers.get("ETag"):
+        _etag_cache[path] = (headers["ETag"], data)
+    return data
+
+
+def _build_query(targets: list[tuple[str, str, int]], search: str | None = None) -> str:
+    """Build one GraphQL document: an optional PR search plus an aliased
+    pullRequest field per (owner, repo, number) target."""
+    fields = []
+    if search is not None:
+        fields.append(
+            f"  search(query: {json.dumps(search)}, type: ISSUE, first: 50) "
+            f"{{ nodes {{ ...PRFields }} }}"
+        )
+    fields.extend(
+        f"  pr{i}: repository(owner: {json.dumps(owner)}, name: {json.dumps(repo)}) "
+        f"{{ pullRequest(number: {number}) {{ ...PRFields }} }}"
+        for i, (owner, repo, number) in enumerate(targets)
+    )
+    return "query {\n" + "\n".join(fields) + "\n}\n" + PR_FIELDS_FRAGMENT
+
+
+def _query_raw(doc: str, variables: dict | None = None) -> bytes | str | None:
+    """Send a GraphQL document and return the raw response body, or None on failure."""
+    body = orjson.dumps({"query": doc, "variables": variables or {}})
+    client = _client
+    if client is not None:
+        result = client.request("POST", "/graphql", body)
+        if result is not None:
+            status, _, raw = result
+            if status != 200:
+                log.warning("GraphQL error: HTTP %d", status)
+                return None
+            return raw
+        if _client is not None:
+            return None
+        # The client was just disabled; retry this call through gh
+    # Send the body on stdin: batched documents can get long for argv
+    return run_gh("api", "graphql", "--input", "-", input_data=body.decode(), json_on_error=True)
+
+
+def _decode_response(raw: bytes | str) -> dict | None:
+    """Parse a GraphQL response body and return its "data" object, or None on failure."""
     try:
-        data = json.loads(raw)
-        pr = data.get("data", {}).get("repository", {}).get("pullRequest")
-        if pr:
-            return normalize_pr(pr, source="watched")
+        resp = orjson.loads(raw)
+    except orjson.JSONDecodeError as e:
+        log.warning("GraphQL parse error: %s", e)
+        return None
+    errors = resp.get("errors")
+    data = resp.get("data")
+    if errors:
+        log.warning("GraphQL errors (%d): %s", len(errors), errors[0].get("message"))
+    if data is None:
+        # Only a null "data" means the whole document failed; field-level
+        # errors (e.g. one watched PR not found) leave that alias null
         return None
-    except (json.JSONDecodeError, KeyError) as e:
-        print(f"Parse error for {owner}/{repo}#{number}: {e}")
+    return data
+
+
+def _run_query(doc: str, variables: dict | None = None) -> dict | None:
+    """Run a GraphQL document and return its "data" object, or None on failure."""
+    raw = _query_raw(doc, variables)
+    return _decode_response(raw) if raw else None
+
+
+# GraphQL ignores ETags, so the next best thing: remember a digest of each
+# document's last response and reuse its normalized result when unchanged.
+_normalized_cache: dict[str, tuple[bytes, object]] = {}
+_NORMALIZED_CACHE_MAX = 32
+_normalized_lock = threading.Lock()
+
+
+def _run_normalized(doc: str, normalize):
+    """Run a GraphQL document and return normalize(data), or None on failure.
+
+    Skips parsing and normalization when the response body is identical to
+    the previous one for the same document.
+    """
+    raw = _query_raw(doc)
+    if not raw:
         return None
+    digest = hashlib.blake2b(raw.encode() if isinstance(raw, str) else raw, digest_size=16).digest()
+    cached = _normalized_cache.get(doc)
+    if cached and cached[0] == digest:
+        return cached[1]
+    data = _decode_response(raw)
+    if data is None:
+        return None
+    result = normalize(data)
+    # Batches run on several pool threads at once
+    with _normalized_lock:
+        _normalized_cache[doc] = (digest, result)
+        while len(_normalized_cache) > _NORMALIZED_CACHE_MAX:
+            _normalized_cache.pop(next(iter(_normalized_cache)), None)
+    return result
+
+
+def _search_prs(data: dict) -> list[PR]:
+    nodes = (data.get("search") or {}).get("nodes", [])
+    return [normalize_pr(n, source="authored") for n in nodes if n]
+
+
+def _aliased_prs(data: dict, count: int) -> list[PR | None]:
+    results = []
+    for i in range(count):
+        pr = (data.get(f"pr{i}") or {}).get("pullRequest")
+        results.append(normalize_pr(pr, source="watched") if pr else None)
+    return results
+
+
+def fetch_my_prs(query: str) -> list[PR]:
+    """Fetch authored PRs via GraphQL search."""
+    return list(_run_normalized(_build_query([], search=query), _search_prs) or [])
+
+
+def fetch_single_pr(owner: str, repo: str, number: int) -> PR | None:
+    """Fetch a single PR by owner/repo/number."""
+    data = _run_query(PR_DETAIL_QUERY, {"owner": owner, "repo": repo, "number": number})
+    pr = ((data or {}).get("repository") or {}).get("pullRequest")
+    if pr:
+        return normalize_pr(pr, source="watched")
+    return None
+
+
+def _fetch_batch(batch: list[tuple[str, str, int]]) -> list[PR | None] | None:
+    """Fetch a batch of watched PRs in one query. Returns None if the batch failed."""
+    return _run_normalized(_build_query(batch), lambda data: _aliased_prs(data, len(batch)))
+
+
+def _batches(targets: list[tuple[str, str, int]]) -> list[list[tuple[str, str, int]]]:
+    return [targets[i:i + WATCHED_BATCH_SIZE] for i in range(0, len(targets), WATCHED_BATCH_SIZE)]
+
+
+def _collect_watched(batches: list, results: list) -> list[PR]:
+    """Flatten batch results in target order, refetching failed batches per-PR."""
+    prs = []
+    for batch, batch_results in zip(batches, results):
+        if batch_results is None:
+            # Only when the whole document failed (e.g. complexity limits)
+            log.warning("batch fetch failed for %d PRs — falling back to per-PR", len(batch))
+            batch_results = _pool.map(lambda t: fetch_single_pr(*t), batch)
+        prs.extend(pr for pr in batch_results if pr)
+    return prs
+
+
+def fetch_watched_prs(targets: list[tuple[str, str, int]]) -> list[PR]:
+    """Fetch watched PRs in concurrent batched GraphQL queries, preserving target order."""
+    batches = _batches(targets)
+    return _collect_watched(batches, list(_pool.map(_fetch_batch, batches)))
+
+
+def fetch_all(query: str, watched: list[tuple[str, str, int]]) -> tuple[list[PR], list[PR]]:
+    """Fetch authored and watched PRs, sharing one GraphQL round-trip.
+
+    The search and the first batch of watched PRs go out as one document;
+    any remaining watched PRs are fetched concurrently in further batches.
+    """
+    first, rest = watched[:WATCHED_BATCH_SIZE], watched[WATCHED_BATCH_SIZE:]
+    rest_batches = _batches(rest)
+    rest_futures = [_pool.submit(_fetch_batch, b) for b in rest_batches]
+    results = _run_normalized(
+        _build_query(first, search=query),
+        lambda data: (_search_prs(data), _aliased_prs(data, len(first))),
+    )
+    rest_prs = _collect_watched(rest_batches, [f.result() for f in rest_futures])
+    if results is None:
+        log.warning("combined fetch failed — fetching authored and watched PRs separately")
+        return fetch_my_prs(query), fetch_watched_prs(first) + rest_prs
+    my_prs, watched_results = results
+    return list(my_prs), [pr for pr in watched_results if pr] + rest_prs
 
 
 def _fetch_mergeable_rest(pr_url: str) -> str | None:
@@ -356,17 +720,94 @@ def _fetch_mergeable_rest(pr_url: str) -> str | None:
     if not parsed:
         return None
     owner, repo, number = parsed
+    if _client is not None:
+        data = _api_get(f"/repos/{owner}/{repo}/pulls/{number}", ("mergeable",))
+        if data is not None:
+            return {True: "MERGEABLE", False: "CONFLICTING"}.get(data.get("mergeable"))
+        if _client is not None:
+            return None
+        # The client was just disabled; retry this call through gh
     raw = run_gh("pr", "view", str(number), "--repo", f"{owner}/{repo}", "--json", "mergeable")
     if raw:
         try:
-            return json.loads(raw).get("mergeable")
-        except (json.JSONDecodeError, KeyError):
+            return orjson.loads(raw).get("mergeable")
+        except (orjson.JSONDecodeError, KeyError):
             pass
     return None
 
 
-def normalize_pr(node: dict, source: str = "authored") -> dict:
-    """Normalize a GraphQL PR node into a flat dict."""
+# Mergeable status changes rarely; serve cached values and refresh stale ones
+# in the background so the REST lookup stays off the fetch path.
+MERGEABLE_TTL_SECONDS = 60
+
+# url -> (mergeable, fetched_at, updatedAt)
+_mergeable_cache: dict[str, tuple[str | None, float, str | None]] = {}
+_mergeable_refreshing: set[str] = set()
+_mergeable_lock = threading.Lock()
+
+
+def _refresh_mergeable(pr_url: str, updated_at: str | None):
+    try:
+        value = _fetch_mergeable_rest(pr_url)
+        if value is None:
+            # Failed or still unknown: keep serving the stale value until the next TTL
+            cached = _mergeable_cache.get(pr_url)
+            value = cached[0] if cached and cached[2] == updated_at else None
+        _mergeable_cache[pr_url] = (value, time.time(), updated_at)
+    finally:
+        with _mergeable_lock:
+            _mergeable_refreshing.discard(pr_url)
+
+
+def _cached_mergeable(pr_url: str, updated_at: str | None) -> str | None:
+    """Mergeable status via REST, with a stale-while-revalidate cache.
+
+    Fetches synchronously only for unseen PRs or when the PR was updated.
+    """
+    cached = _mergeable_cache.get(pr_url)
+    if cached is None or cached[2] != updated_at:
+        value = _fetch_mergeable_rest(pr_url)
+        _mergeable_cache[pr_url] = (value, time.time(), updated_at)
+        return value
+    value, fetched_at, _ = cached
+    if time.time() - fetched_at >= MERGEABLE_TTL_SECONDS:
+        with _mergeable_lock:
+            if pr_url not in _mergeable_refreshing:
+                _mergeable_refreshing.add(pr_url)
+                _pool.submit(_refresh_mergeable, pr_url, updated_at)
+    return value
+
+
+def prune_mergeable_cache(pr_urls: set[str]):
+    """Drop cached mergeable values and REST lookups for PRs that are no longer
+    shown (closed, dismissed, or out of the search)."""
+    for url in list(_mergeable_cache):
+        if url not in pr_urls:
+            _mergeable_cache.pop(url, None)
+    live = {f"/repos/{o}/{r}/pulls/{n}" for o, r, n in filter(None, map(parse_pr_url, pr_urls))}
+    for path in list(_etag_cache):
+        if path not in live:
+            _etag_cache.pop(path, None)
+
+
+def resolve_mergeable(prs: list[PR]) -> list[PR]:
+    """Fill in mergeable via REST for PRs where GraphQL reported UNKNOWN.
+
+    Runs as a concurrent post-pass over normalized PRs. Returns copies so
+    cached normalized results keep the raw GraphQL value.
+    """
+    pending = [pr for pr in prs if pr.mergeable in ("UNKNOWN", None) and pr.url]
+    if not pending:
+        return prs
+    values = dict(zip(
+        (pr.url for pr in pending),
+        _pool.map(lambda pr: _cached_mergeable(pr.url, pr.updatedAt), pending),
+    ))
+    return [replace(pr, mergeable=values[pr.url]) if values.get(pr.url) else pr for pr in prs]
+
+
+def normalize_pr(node: dict, source: str = "authored") -> PR:
+    """Normalize a GraphQL PR node into a flat PR record."""
     # CI state
     ci_state = None
     commits = node.get("commits", {}).get("nodes", [])
@@ -411,43 +852,52 @@ def normalize_pr(node: dict, source: str = "authored") -> dict:
     in_merge_queue = mq is not None
     merge_queue_position = mq.get("position") if mq else None
 
-    # Mergeable — GraphQL often returns UNKNOWN; fall back to REST
-    mergeable = node.get("mergeable")
-    if mergeable in ("UNKNOWN", None) and node.get("url"):
-        mergeable = _fetch_mergeable_rest(node["url"]) or mergeable
-
     repo = node.get("repository", {}).get("nameWithOwner", "")
 
-    return {
-        "number": node.get("number"),
-        "title": node.get("title", ""),
-        "url": node.get("url", ""),
-        "repo": repo,
-        "repo_short": repo.split("/")[-1] if "/" in repo else repo,
-        "isDraft": node.get("isDraft", False),
-        "state": node.get("state", "OPEN"),
-        "createdAt": node.get("createdAt"),
-        "updatedAt": node.get("updatedAt"),
-        "mergeable": mergeable,
-        "in_merge_queue": in_merge_queue,
-        "merge_queue_position": merge_queue_position,
-        "ci_state": ci_state,
-        "ci_icon": ci_icon(ci_state),
-        "ci_label": ci_label(ci_state),
-        "review_decision": review_decision,
-        "review_icon": review_icon(review_decision),
-        "review_label": review_label(review_decision),
-        "status_icon": combined_icon(ci_state, review_decision, node.get("state", "OPEN"), in_merge_queue, node.get("mergeable")),
-        "checks": checks,
-        "reviews": reviews,
-        "labels": labels,
-        "source": source,
-        "author": node.get("author", {}).get("login") if "author" in node else None,
-    }
+    return PR(
+        number=node.get("number"),
+        title=node.get("title", ""),
+        url=node.get("url", ""),
+        repo=repo,
+        repo_short=repo.split("/")[-1] if "/" in repo else repo,
+        isDraft=node.get("isDraft", False),
+        state=node.get("state", "OPEN"),
+        createdAt=node.get("createdAt"),
+        updatedAt=node.get("updatedAt"),
+        # GraphQL often returns UNKNOWN; resolve_mergeable() falls back to REST
+        mergeable=node.get("mergeable"),
+        in_merge_queue=in_merge_queue,
+        merge_queue_position=merge_queue_position,
+        ci_state=ci_state,
+        ci_icon=ci_icon(ci_state),
+        ci_label=ci_label(ci_state),
+        review_decision=review_decision,
+        review_icon=review_icon(review_decision),
+        review_label=review_label(review_decision),
+        status_icon=combined_icon(ci_state, review_decision, node.get("state", "OPEN"), in_merge_queue, node.get("mergeable")),
+        checks=checks,
+        reviews=reviews,
+        labels=labels,
+        source=source,
+        author=node.get("author", {}).get("login") if "author" in node else None,
+    )
+
 
+# Digest of the PR data last written to prs.json
+_last_saved_digest: bytes | None = None
 
-def save_pr_data(my_prs: list[dict], watched_prs: list[dict]):
-    """Write all PR data to JSON for agent consumption."""
+
+def save_pr_data(my_prs: list[PR], watched_prs: list[PR]):
+    """Write all PR data to JSON for agent consumption.
+
+    Skipped when the PR data is unchanged since the last write, so
+    last_updated is the time the data last changed. The file is replaced
+    atomically so readers never see a partial write.
+    """
+    global _last_saved_digest
+    digest = hashlib.blake2b(orjson.dumps([my_prs, watched_prs]), digest_size=16).digest()
+    if digest == _last_saved_digest and PR_JSON_FILE.exists():
+        return
     DATA_DIR.mkdir(parents=True, exist_ok=True)
     output = {
         "last_updated": datetime.now(timezone.utc).isoformat(),
@@ -456,22 +906,112 @@ def save_pr_data(my_prs: list[dict], watched_prs: list[dict]):
         "watched_prs": watched_prs,
         "all_prs": my_prs + watched_prs,
     }
-    with open(PR_JSON_FILE, "w") as f:
-        json.dump(output, f, indent=2)
+    tmp = PR_JSON_FILE.with_suffix(".json.tmp")
+    # orjson serializes PR dataclasses natively, in field order
+    tmp.write_bytes(orjson.dumps(output, option=orjson.OPT_INDENT_2))
+    os.replace(tmp, PR_JSON_FILE)
+    _last_saved_digest = digest
+
+
+# ── Menu rendering ─────────────────────────────────────────────────────
+def menu_title(prs: list[PR]) -> str:
+    """Menu bar title: open PR count, flagged if any need attention."""
+    total = failing = needs_attn = 0
+    for p in prs:
+        if p.state != "OPEN":
+            continue
+        total += 1
+        failing += p.ci_state in ("FAILURE", "ERROR")
+        needs_attn += p.review_decision == "CHANGES_REQUESTED"
+
+    if failing > 0:
+        return f"𝓟𝓡𝓼 ❌{total}"
+    elif needs_attn > 0:
+        return f"𝓟𝓡𝓼 🔴{total}"
+    return f"𝓟𝓡𝓼 {total}"
+
+
+def pr_menu_labels(pr: PR, now: float) -> tuple[str, str | None]:
+    """(main line, detail line) menu labels for a PR; no detail line once merged/closed."""
+    icon = pr.status_icon
+    draft = " [draft]" if pr.isDraft else ""
+    title_text = pr.title[:55]
+    updated = time_ago(pr.updatedAt, now) if pr.updatedAt else ""
+    is_done = pr.state in ("MERGED", "CLOSED")
+
+    state_suffix = ""
+    if pr.state == "MERGED":
+        state_suffix = " — merged"
+    elif pr.state == "CLOSED":
+        state_suffix = " — closed"
+    main_label = f"{icon}  {pr.repo_short}#{pr.number}: {title_text}{draft}{state_suffix}"
+
+    if is_done:
+        return main_label, None
+
+    # Detail line: CI + review status + author + time + failing checks
+    parts = []
+    if pr.in_merge_queue:
+        pos = pr.merge_queue_position
+        parts.append(f"Merge queue #{pos}" if pos is not None else "Merge queue")
+    elif pr.mergeable == "CONFLICTING":
+        parts.append("Has conflicts")
+    else:
+        parts.extend([pr.ci_label, pr.review_label])
+    if pr.source == "watched" and pr.author:
+        parts.append(f"by {pr.author}")
+    if updated:
+        parts.append(updated)
+    failing_checks = [
+        c for c in pr.checks
+        if c.get("conclusion") in ("FAILURE", "failure", "ERROR", "error")
+    ]
+    if failing_checks:
+        names = ", ".join(c["name"] for c in failing_checks[:3])
+        parts.append(f"✕ {names}")
+    return main_label, f"     {' · '.join(parts)}"
+
+
+@dataclass(frozen=True, slots=True)
+class MenuSnapshot:
+    """Everything the menu displays, rendered off the main thread."""
+    my_prs: list[PR]
+    watched_prs: list[PR]
+    title: str
+    labels: list[tuple[str, str | None]]  # (main, detail) per PR, mine then watched
+
+    def fingerprint(self) -> int:
+        """Hash of the displayed content, to skip rebuilds when nothing changed."""
+        all_prs = self.my_prs + self.watched_prs
+        return hash((self.title, tuple((pr.source, pr.url, *l) for pr, l in zip(all_prs, self.labels))))
+
+
+def render_menu(my_prs: list[PR], watched_prs: list[PR]) -> MenuSnapshot:
+    """Render the menu title and labels, sharing one clock reading."""
+    all_prs = my_prs + watched_prs
+    now = time.time()
+    return MenuSnapshot(my_prs, watched_prs, menu_title(all_prs), [pr_menu_labels(pr, now) for pr in all_prs])
 
 
 # ── Menu Bar App ───────────────────────────────────────────────────────
 class PRWatchApp(rumps.App):
     def __init__(self):
         super().__init__("PR", quit_button=None)
-        log.info("PRWatchApp starting (pid=%d, thread=%s)", __import__("os").getpid(), threading.current_thread().name)
+        log.info("PRWatchApp starting (pid=%d, thread=%s)", os.getpid(), threading.current_thread().name)
         self.config_data = load_config()
-        self.my_prs: list[dict] = []
-        self.watched_prs: list[dict] = []
+        self.my_prs: list[PR] = []
+        self.watched_prs: list[PR] = []
+        # Rendered by the worker, applied by the main thread
+        self._snapshot = render_menu([], [])
         self.icon = None  # Use text-only title
-        self._fetch_pending = True
-        self._fetching = False
+        self._fetch_pending_at: float | None = 0.0  # fetch right away at startup
         self._needs_rebuild = False
+        self._needs_stamp = False  # fetch succeeded but menu content unchanged
+        self._last_menu_hash: int | None = None
+        self._info_item = None
+        # Current PR menu items and the layout they were built for
+        self._pr_items: list[tuple[rumps.MenuItem, rumps.MenuItem | None]] = []
+        self._menu_layout: tuple | None = None
         self._consecutive_failures = 0
         self._error_title = None  # set from bg thread, applied on main thread
 
@@ -482,9 +1022,9 @@ class PRWatchApp(rumps.App):
 
         # Keep a strong reference to the NSStatusItem to prevent GC
         self._status_item_ref = None
-        self._tick_count = 0
 
-        # Persistent worker thread — wakes on signal instead of spawning new threads
+        # Persistent worker thread — schedules its own fetches and wakes early
+        # when signalled, so the main thread is only woken when there is UI work
         self._fetch_event = Event()
         self._worker = Thread(target=self._worker_loop, daemon=True, name="pr-watch-worker")
         self._worker.start()
@@ -492,8 +1032,8 @@ class PRWatchApp(rumps.App):
         # Listen for display configuration changes (monitor plug/unplug, wake, etc.)
         self._register_display_notifications()
 
-        # Single tick timer runs on main thread
-        self._tick_timer = rumps.Timer(self._tick, 1)
+        # Status item health check runs on main thread
+        self._tick_timer = rumps.Timer(self._tick, 60)
         self._tick_timer.start()
 
     def _ensure_status_item(self):
@@ -526,47 +1066,61 @@ class PRWatchApp(rumps.App):
         """Called when display configuration changes — re-assert status item."""
         log.info("display configuration changed — refreshing status item")
         self._ensure_status_item()
+        self._menu_layout = None  # force a full rebuild
         self._needs_rebuild = True
+        self._apply_updates()
 
     def _tick(self, _sender):
-        """Main-thread tick."""
-        import time as _time
-        now = _time.time()
-        self._tick_count += 1
-
-        # Periodic status item health check (every 60s)
-        if self._tick_count % 60 == 0:
-            self._ensure_status_item()
+        """Main-thread tick: periodic status item health check."""
+        self._ensure_status_item()
 
+    def _apply_updates(self):
+        """Main thread: apply the results of a background fetch to the menu."""
         # Rebuild menu if background fetch completed
         if self._needs_rebuild:
             self._needs_rebuild = False
             # Apply error title from bg thread safely on main thread
-            if self._error_title:
-                log.warning("setting error title on main thread: %s", self._error_title)
-                self.title = self._error_title
+            error_title = self._error_title
+            if error_title:
+                log.warning("setting error title on main thread: %s", error_title)
+                self.title = error_title
                 self._error_title = None
             try:
-                self._rebuild_menu()
+                self._rebuild_menu(keep_title=bool(error_title))
             except Exception as e:
                 import traceback
                 log.error("rebuild error: %s\n%s", e, traceback.format_exc())
 
-        # Signal the worker thread if a fetch is needed
-        if not self._fetching:
-            if self._fetch_pending or (now - self._last_fetch_time >= self._refresh_interval):
-                self._fetch_pending = False
-                self._fetching = True
-                self._last_fetch_time = now
-                self._fetch_event.set()
+        # Unchanged fetch: only the "Updated" timestamp needs refreshing
+        elif self._needs_stamp:
+            self._needs_stamp = False
+            if self._info_item is not None:
+                self._info_item.title = self._info_label()
+
+    def _request_fetch(self):
+        """Ask for a refetch soon, coalescing bursts of dismiss/add actions into one."""
+        self._fetch_pending_at = time.time() + FETCH_DEBOUNCE_SECONDS
+        self._fetch_event.set()
 
     def _worker_loop(self):
-        """Persistent worker thread — waits for signal, fetches, repeats."""
+        """Persistent worker thread — sleeps until the next fetch is due or a
+        fetch is requested, fetches, then hands the result to the main thread."""
         log.info("worker thread started")
+        # Resolve the token here, not in __init__: `gh auth token` can block
+        init_github_client()
         while True:
-            self._fetch_event.wait()
-            self._fetch_event.clear()
+            now = time.time()
+            due = self._last_fetch_time + self._refresh_interval
+            if self._fetch_pending_at is not None:
+                due = min(due, self._fetch_pending_at)
+            if now < due:
+                self._fetch_event.wait(due - now)
+                self._fetch_event.clear()
+                continue
+            self._fetch_pending_at = None
+            self._last_fetch_time = now
             self._do_fetch()
+            AppHelper.callAfter(self._apply_updates)
 
     def _do_fetch(self):
         """Background thread: fetch data, set flag for main-thread rebuild."""
@@ -576,22 +1130,30 @@ class PRWatchApp(rumps.App):
             self.config_data = load_config()
 
             query = self.config_data.get("my_prs_query", DEFAULT_CONFIG["my_prs_query"])
-            self.my_prs = fetch_my_prs(query)
             dismissed = {normalize_url(u) for u in self.config_data.get("dismissed_prs", [])}
 
-            self.watched_prs = []
+            targets = []
             for url in self.config_data.get("watched_prs", []):
                 if normalize_url(url) in dismissed:
                     continue
                 parsed = parse_pr_url(url)
                 if parsed:
-                    owner, repo, number = parsed
-                    pr = fetch_single_pr(owner, repo, number)
-                    if pr and not any(p["url"] == pr["url"] for p in self.my_prs):
-                        self.watched_prs.append(pr)
+                    targets.append(parsed)
+
+            my_prs, watched_prs = fetch_all(query, targets)
+            my_urls = {p.url for p in my_prs}
+            self.my_prs = resolve_mergeable(my_prs)
+            self.watched_prs = resolve_mergeable([pr for pr in watched_prs if pr.url not in my_urls])
+            prune_mergeable_cache({pr.url for pr in self.my_prs + self.watched_prs})
 
             save_pr_data(self.my_prs, self.watched_prs)
-            self._needs_rebuild = True
+            self._snapshot = render_menu(self.my_prs, self.watched_prs)
+            menu_hash = self._snapshot.fingerprint()
+            if menu_hash != self._last_menu_hash:
+                self._last_menu_hash = menu_hash
+                self._needs_rebuild = True
+            else:
+                self._needs_stamp = True
             self._consecutive_failures = 0
             log.debug("fetch ok — %d authored, %d watched", len(self.my_prs), len(self.watched_prs))
 
@@ -599,111 +1161,102 @@ class PRWatchApp(rumps.App):
             self._consecutive_failures += 1
             log.error("fetch failed (consecutive=%d):\n%s", self._consecutive_failures, traceback.format_exc())
             self._error_title = "⚠️"
+            self._last_menu_hash = None  # next successful fetch must restore the title
             self._needs_rebuild = True  # let main thread set the title safely
-        finally:
-            self._fetching = False
-
-    def _rebuild_menu(self):
-        """Rebuild the entire dropdown menu. Runs on main thread."""
-        log.debug("rebuild_menu started (thread=%s)", threading.current_thread().name)
-        all_prs = self.my_prs + self.watched_prs
-        open_prs = [p for p in all_prs if p.get("state") == "OPEN"]
-        total = len(open_prs)
 
-        failing = sum(1 for p in open_prs if p["ci_state"] in ("FAILURE", "ERROR"))
-        needs_attn = sum(1 for p in open_prs if p["review_decision"] == "CHANGES_REQUESTED")
-
-        if failing > 0:
-            self.title = f"𝓟𝓡𝓼 ❌{total}"
-        elif needs_attn > 0:
-            self.title = f"𝓟𝓡𝓼 🔴{total}"
-        else:
-            self.title = f"𝓟𝓡𝓼 {total}"
+    def _rebuild_menu(self, keep_title: bool = False):
+        """Bring the dropdown menu up to date. Runs on main thread.
 
+        When the same PRs are listed in the same order, existing items are
+        relabelled in place; otherwise the whole menu is rebuilt. keep_title
+        leaves an error title in place instead of the snapshot's.
+        """
+        log.debug("rebuild_menu started (thread=%s)", threading.current_thread().name)
+        snap = self._snapshot
+        all_prs = snap.my_prs + snap.watched_prs
+        labels = snap.labels
+        if not keep_title:
+            self.title = snap.title
+
+        layout = tuple(
+            (pr.source, pr.url, detail is not None)
+            for pr, (_, detail) in zip(all_prs, labels)
+        )
+        if layout == self._menu_layout:
+            self._info_item.title = self._info_label()
+            for (main_item, detail_item), (main_label, detail_label) in zip(self._pr_items, labels):
+                if main_item.title != main_label:
+                    main_item.title = main_label
+                if detail_item is not None and detail_item.title != detail_label:
+                    detail_item.title = detail_label
+            return
+
+        log.debug("menu layout changed — full rebuild")
         # Wipe the old menu
         self.menu.clear()
+        self._pr_items = []
 
         # ── Header ────────────────────────────────────────
-        ts = datetime.now().strftime("%H:%M")
-        info = rumps.MenuItem(f"Updated {ts}  ·  ⌥-click to dismiss")
+        info = rumps.MenuItem(self._info_label())
         info.set_callback(None)
         self.menu.add(info)
+        self._info_item = info
         self.menu.add(rumps.MenuItem("+ Add", callback=self._on_add_pr))
         self.menu.add(rumps.separator)
 
         # ── My PRs ────────────────────────────────────────
-        if self.my_prs:
+        n_mine = len(snap.my_prs)
+        if snap.my_prs:
             header = rumps.MenuItem("Mine")
             header.set_callback(None)
             self.menu.add(header)
-            for pr in self.my_prs:
-                self._add_pr_items(pr)
+            for pr, pr_labels in zip(snap.my_prs, labels[:n_mine]):
+                self._pr_items.append(self._add_pr_items(pr, pr_labels))
 
         # ── Watched PRs ───────────────────────────────────
-        if self.watched_prs:
+        if snap.watched_prs:
             self.menu.add(rumps.separator)
             header = rumps.MenuItem("Watching")
             header.set_callback(None)
             self.menu.add(header)
-            for pr in self.watched_prs:
-                self._add_pr_items(pr)
+            for pr, pr_labels in zip(snap.watched_prs, labels[n_mine:]):
+                self._pr_items.append(self._add_pr_items(pr, pr_labels))
 
         # ── Footer ───────────────────────────────────────
         self.menu.add(rumps.separator)
         self.menu.add(rumps.MenuItem("Quit", callback=rumps.quit_application))
+        self._menu_layout = layout
 
-    def _add_pr_items(self, pr: dict):
-        """Add flat menu items for a single PR (no nested submenus)."""
-        icon = pr.get("status_icon", pr["ci_icon"])
-        draft = " [draft]" if pr["isDraft"] else ""
-        title_text = pr["title"][:55]
-        updated = time_ago(pr["updatedAt"]) if pr.get("updatedAt") else ""
-        is_done = pr.get("state") in ("MERGED", "CLOSED")
+    def _info_label(self) -> str:
+        ts = datetime.now().strftime("%H:%M")
+        return f"Updated {ts}  ·  ⌥-click to dismiss"
+
+    def _add_pr_items(self, pr: PR, labels: tuple[str, str | None]) -> tuple[rumps.MenuItem, rumps.MenuItem | None]:
+        """Add flat menu items for a single PR (no nested submenus).
+
+        Returns the (main, detail) items so later refreshes can relabel them.
+        """
+        main_label, detail_label = labels
 
         # Main line: clickable, opens PR in browser
-        state_suffix = ""
-        if pr.get("state") == "MERGED":
-            state_suffix = " — merged"
-        elif pr.get("state") == "CLOSED":
-            state_suffix = " — closed"
-        main_label = f"{icon}  {pr['repo_short']}#{pr['number']}: {title_text}{draft}{state_suffix}"
-        open_item = rumps.MenuItem(main_label, callback=self._make_open_cb(pr["url"]))
+        open_item = rumps.MenuItem(main_label, callback=self._make_open_cb(pr.url))
         self.menu.add(open_item)
 
         # Alternate item: shown when Option is held — only for watched PRs
-        if pr.get("source") == "watched":
+        if pr.source == "watched":
             from AppKit import NSAlternateKeyMask
-            dismiss_label = f"     ✕  Dismiss #{pr['number']}"
-            dismiss_item = rumps.MenuItem(dismiss_label, callback=self._make_dismiss_cb(pr["url"], "watched"))
+            dismiss_label = f"     ✕  Dismiss #{pr.number}"
+            dismiss_item = rumps.MenuItem(dismiss_label, callback=self._make_dismiss_cb(pr.url, "watched"))
             dismiss_item._menuitem.setAlternate_(True)
             dismiss_item._menuitem.setKeyEquivalentModifierMask_(NSAlternateKeyMask)
             self.menu.add(dismiss_item)
 
-        if not is_done:
-            # Detail line: CI + review status + author + time + failing checks
-            parts = []
-            if pr.get("in_merge_queue"):
-                pos = pr.get("merge_queue_position")
-                parts.append(f"Merge queue #{pos}" if pos is not None else "Merge queue")
-            elif pr.get("mergeable") == "CONFLICTING":
-                parts.append("Has conflicts")
-            else:
-                parts.extend([pr["ci_label"], pr["review_label"]])
-            if pr.get("source") == "watched" and pr.get("author"):
-                parts.append(f"by {pr['author']}")
-            if updated:
-                parts.append(updated)
-            failing_checks = [
-                c for c in pr.get("checks", [])
-                if c.get("conclusion") in ("FAILURE", "failure", "ERROR", "error")
-            ]
-            if failing_checks:
-                names = ", ".join(c["name"] for c in failing_checks[:3])
-                parts.append(f"✕ {names}")
-            detail_label = f"     {' · '.join(parts)}"
+        detail = None
+        if detail_label is not None:
             detail = rumps.MenuItem(detail_label)
             detail.set_callback(None)
             self.menu.add(detail)
+        return open_item, detail
 
 
     def _make_open_cb(self, url: str):
@@ -720,7 +1273,7 @@ class PRWatchApp(rumps.App):
                 ]
             self.config_data.setdefault("dismissed_prs", []).append(norm)
             save_config(self.config_data)
-            self._fetch_pending = True
+            self._request_fetch()
         return cb
 
 
@@ -737,8 +1290,8 @@ class PRWatchApp(rumps.App):
         '''
         try:
             result = subprocess.run(
-                ["osascript", "-e", script],
-                capture_output=True, text=True, timeout=60,
+                [_exe("osascript"), "-e", script],
+                capture_output=True, text=True, timeout=60, close_fds=False,
             )
             if result.returncode != 0:
                 return  # User cancelled
@@ -747,10 +1300,11 @@ class PRWatchApp(rumps.App):
                 if url not in self.config_data.get("watched_prs", []):
                     self.config_data.setdefault("watched_prs", []).append(url)
                     save_config(self.config_data)
-                    self._fetch_pending = True
+                    self._request_fetch()
             elif url and url != "https://github.com/org/repo/pull/123":
-                subprocess.run(["osascript", "-e",
-                    'display alert "Invalid URL" message "Paste a URL like: https://github.com/org/repo/pull/123"'])
+                subprocess.run([_exe("osascript"), "-e",
+                    'display alert "Invalid URL" message "Paste a URL like: https://github.com/org/repo/pull/123"'],
+                    close_fds=False)
         except subprocess.TimeoutExpired:
             pass
 